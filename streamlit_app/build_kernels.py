@@ -0,0 +1,27 @@
+"""
+Ahead-of-time build of the entry timing kernel
+Compiles zone_based_strategy/_entry_timing_aot so the entry timing module
+loads the rejection scan without JIT compiling it. Requires numba:
+
+    python build_kernels.py
+
+Rerun after changing zone_based_strategy/_entry_timing_kernels.py
+"""
+
+import os
+from numba.pycc import CC
+from zone_based_strategy._entry_timing_kernels import DETECT_REJECTION_SIG, _scan_rejection
+
+PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'zone_based_strategy')
+
+
+def build():
+    """Compile the AOT extension module into the strategy package"""
+    cc = CC('_entry_timing_aot')
+    cc.output_dir = PACKAGE_DIR
+    cc.export('detect_rejection', DETECT_REJECTION_SIG)(_scan_rejection)
+    cc.compile()
+
+
+if __name__ == '__main__':
+    build()
@@ -1,9 +1,6 @@
 import oandapyV20
 import oandapyV20.endpoints.instruments as instruments
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.patches import Rectangle
 from datetime import datetime, timedelta
 import config
 import numpy as np
@@ -37,21 +34,22 @@ class OandaTrader:
             response = self.api.request(r)
             candles = response['candles']
             
-            data = []
-            for candle in candles:
-                if candle['complete']:
-                    data.append({
-                        'time': candle['time'],
-                        'open': float(candle['mid']['o']),
-                        'high': float(candle['mid']['h']),
-                        'low': float(candle['mid']['l']),
-                        'close': float(candle['mid']['c']),
-                        'volume': int(candle['volume'])
-                    })
+            # Build typed columns directly instead of a list of row dicts,
+            # so pandas skips per-row dtype inference
+            complete = [candle for candle in candles if candle['complete']]
+            mids = [candle['mid'] for candle in complete]
             
-            df = pd.DataFrame(data)
-            df['time'] = pd.to_datetime(df['time'])
-            df.set_index('time', inplace=True)
+            df = pd.DataFrame(
+                {
+                    'open': np.array([mid['o'] for mid in mids], dtype=np.float64),
+                    'high': np.array([mid['h'] for mid in mids], dtype=np.float64),
+                    'low': np.array([mid['l'] for mid in mids], dtype=np.float64),
+                    'close': np.array([mid['c'] for mid in mids], dtype=np.float64),
+                    'volume': np.array([candle['volume'] for candle in complete], dtype=np.int64)
+                },
+                index=pd.DatetimeIndex(pd.to_datetime([candle['time'] for candle in complete]),
+                                       name='time')
+            )
             
             return df
             
@@ -76,6 +74,10 @@ class OandaTrader:
         if not config.SHOW_CHARTS:
             return
         
+        # Charts are optional, so matplotlib is only imported when drawing one
+        import matplotlib.pyplot as plt
+        from matplotlib.patches import Rectangle
+        
         # Set style for professional look
         plt.style.use('dark_background')
         fig, ax = plt.subplots(figsize=(15, 8))
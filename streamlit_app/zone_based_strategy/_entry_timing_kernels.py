@@ -0,0 +1,63 @@
+"""
+Compiled zone scan for EntryTiming._detect_zone_rejection
+Loaded from the ahead-of-time build when present, JIT-compiled otherwise
+Directions are returned as integer codes: 1 bullish, -1 bearish, 0 none
+"""
+
+import numpy as np
+from ._njit import njit, FASTMATH
+
+# Floor for the body size divisor; real candle bodies are either 0 or many
+# orders of magnitude larger, so this only keeps the division defined
+_MIN_BODY = 1e-12
+
+# Candle scalars and the ZoneTable bound arrays are all float64
+DETECT_REJECTION_SIG = ('Tuple((int64, int64, float64, float64))'
+                        '(float64, float64, float64, float64, '
+                        'float64[::1], float64[::1], float64[::1], float64)')
+
+
+def _scan_rejection(open_, high, low, close, lowers, uppers, centers, ratio):
+    """
+    Return (zone index, direction, wick strength, bounce distance) for the
+    first zone the candle rejects, checking bullish before bearish per zone
+    The index is -1 when no zone is rejected
+    """
+    body_size = np.fabs(close - open_)
+    # Branch-free wicks: distance from the body edge to the low / high
+    lower_wick = min(open_, close) - low
+    upper_wick = high - max(open_, close)
+
+    # Wick checks only depend on the candle; without a long enough wick no
+    # zone can be rejected, so the zone scan is skipped entirely
+    thresh = body_size * ratio
+    bullish_wick = lower_wick > thresh
+    bearish_wick = upper_wick > thresh
+    if not (bullish_wick or bearish_wick):
+        return -1, 0, 0.0, 0.0
+
+    # Both divisions are always defined, so the doji fallback of 5.0 is a
+    # select, not a branch
+    has_body = body_size > 0.0
+    safe_body = max(body_size, _MIN_BODY)
+    bullish_strength = lower_wick / safe_body if has_body else 5.0
+    bearish_strength = upper_wick / safe_body if has_body else 5.0
+
+    for i in range(lowers.shape[0]):
+        # Bullish rejection from support zone
+        if bullish_wick and low <= lowers[i] and close > centers[i]:
+            return i, 1, bullish_strength, close - low
+
+        # Bearish rejection from resistance zone
+        if bearish_wick and high >= uppers[i] and close < centers[i]:
+            return i, -1, bearish_strength, high - close
+
+    return -1, 0, 0.0, 0.0
+
+
+
+try:
+    # Ahead-of-time build from build_kernels.py; nothing to compile at import
+    from ._entry_timing_aot import detect_rejection as _detect_rejection
+except ImportError:
+    _detect_rejection = njit(DETECT_REJECTION_SIG, cache=True, fastmath=FASTMATH)(_scan_rejection)
@@ -0,0 +1,27 @@
+"""
+Optional Numba support
+Kernels decorated with njit run compiled when numba is installed and as
+plain Python otherwise
+"""
+
+import os
+
+# Persist compiled kernels next to the package so reruns skip the JIT step
+_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.numba_cache')
+if os.access(os.path.dirname(_CACHE_DIR), os.W_OK):
+    os.environ.setdefault('NUMBA_CACHE_DIR', _CACHE_DIR)
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# fastmath flags that keep NaN/inf semantics (kernels rely on x == x checks)
+FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
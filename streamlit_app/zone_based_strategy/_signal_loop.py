@@ -0,0 +1,58 @@
+"""
+Scoring loop for ZoneTrader._calculate_signal_strength
+Signals are passed as small integer codes instead of strings
+"""
+
+from bisect import bisect_right
+
+# Confluence signal -> (direction, base confidence)
+_CONF = {
+    'STRONG_BULLISH': (1, 40),
+    'STRONG_BEARISH': (-1, 40),
+    'BULLISH': (1, 20),
+    'BEARISH': (-1, 20)
+}
+
+# Trend bias -> direction
+_BIAS = {'BULLISH': 1, 'BEARISH': -1}
+
+# Confidence thresholds for the WEAK / plain / STRONG strength buckets
+_THRESHOLDS = (30, 50, 70)
+
+# Result code -> final signal, code = (direction + 1) * 4 + strength bucket
+# Without a direction the signal stays NO_SIGNAL whatever the confidence
+_SIGNALS = (
+    'NO_SIGNAL', 'WEAK_BEARISH', 'BEARISH', 'STRONG_BEARISH',
+    'NO_SIGNAL', 'NO_SIGNAL', 'NO_SIGNAL', 'NO_SIGNAL',
+    'NO_SIGNAL', 'WEAK_BULLISH', 'BULLISH', 'STRONG_BULLISH'
+)
+
+# Result code -> trade direction (-1 bearish, 0 none, 1 bullish)
+_DIRECTIONS = tuple(
+    0 if 'NO_SIGNAL' in signal else (1 if 'BULLISH' in signal else -1)
+    for signal in _SIGNALS
+)
+
+
+def _score(direction, base_confidence, has_bias, bias, strong_trend, n_hq_zones, is_spike):
+    """Return (signal code, confidence) for the encoded signal inputs"""
+    confidence = base_confidence
+
+    # Zone quality contribution
+    confidence += n_hq_zones * 15
+
+    # Trend alignment contribution
+    if has_bias:
+        if direction != 0 and direction == bias:
+            confidence += 25 if strong_trend else 15
+        else:
+            confidence -= 20  # Counter-trend penalty
+
+    # Volume contribution
+    if is_spike:
+        confidence += 10
+
+    # Final signal determination: number of thresholds reached
+    bucket = bisect_right(_THRESHOLDS, confidence)
+
+    return (direction + 1) * 4 + bucket, min(confidence, 100)
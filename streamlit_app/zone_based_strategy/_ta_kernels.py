@@ -0,0 +1,148 @@
+"""
+Compiled kernels for moving averages and ATR
+Outputs match the pandas ewm(adjust=False) / rolling().mean() equivalents
+Each kernel is compiled for float64 price data; running state is kept in
+float64 and the output has the input dtype
+"""
+
+import numpy as np
+from ._njit import njit, FASTMATH
+
+_KERNEL_OPTIONS = dict(cache=True, fastmath=FASTMATH, boundscheck=False, error_model='numpy')
+_FLOAT_TYPES = ('float64',)
+
+
+def _signatures(template):
+    """Expand a signature template over the supported float types"""
+    return [template.format(t=t) for t in _FLOAT_TYPES]
+
+
+@njit(_signatures('{t}[::1]({t}[::1], float64)'), **_KERNEL_OPTIONS)
+def _ewm_adjust_false(values, alpha):
+    """Exponential moving average, same recurrence as pandas adjust=False"""
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    if n == 0:
+        return out
+
+    old_wt_factor = 1.0 - alpha
+    weighted = np.float64(values[0])
+    old_wt = 1.0
+    out[0] = weighted
+
+    for i in range(1, n):
+        cur = values[i]
+        is_observation = cur == cur
+        if weighted == weighted:
+            old_wt *= old_wt_factor
+            if is_observation:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_observation:
+            weighted = cur
+        out[i] = weighted
+
+    return out
+
+
+@njit(**_KERNEL_OPTIONS)
+def _fill_mas_and_atr(high, low, close, n, alphas, period, out):
+    """
+    Write the three EMAs of close[:n] into out[:3, :n] and the ATR into out[3, :n]
+    One pass over high/low/close; the true range window lives in a ring buffer
+    """
+    if n == 0:
+        return
+
+    weighted = np.empty(3)
+    weighted[:] = close[0]
+    old_wt = np.ones(3)
+    out[:3, 0] = weighted
+
+    window = np.empty(period, dtype=high.dtype)
+    total = 0.0
+    nobs = 0
+
+    for i in range(n):
+        # True range; the first candle has no previous close so uses high - low
+        tr = high[i] - low[i]
+        if i > 0:
+            tr = max(tr, abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        if tr == tr:
+            total += tr
+            nobs += 1
+        slot = i % period
+        if i >= period:
+            old = window[slot]
+            if old == old:
+                total -= old
+                nobs -= 1
+        window[slot] = tr
+        out[3, i] = total / nobs if nobs >= period else np.nan
+
+        if i == 0:
+            continue
+        cur = close[i]
+        is_observation = cur == cur
+        for k in range(3):
+            if weighted[k] == weighted[k]:
+                old_wt[k] *= 1.0 - alphas[k]
+                if is_observation:
+                    if weighted[k] != cur:
+                        weighted[k] = (old_wt[k] * weighted[k] + alphas[k] * cur) / (old_wt[k] + alphas[k])
+                    old_wt[k] = 1.0
+            elif is_observation:
+                weighted[k] = cur
+            out[k, i] = weighted[k]
+
+
+@njit(_signatures('{t}[:, ::1]({t}[::1], {t}[::1], {t}[::1], float64, float64, float64, int64)'),
+      **_KERNEL_OPTIONS)
+def _mas_and_atr(high, low, close, a_fast, a_slow, a_trend, period):
+    """Fast, slow and trend EMAs plus ATR in a single pass, returned as four rows"""
+    n = close.shape[0]
+    out = np.empty((4, n), dtype=close.dtype)
+    _fill_mas_and_atr(high, low, close, n, np.array([a_fast, a_slow, a_trend]), period, out)
+    return out
+
+
+@njit(_signatures('{t}[::1]({t}[::1], int64)'), **_KERNEL_OPTIONS)
+def _running_mean(values, window):
+    """Rolling mean; NaN until the window holds `window` observations"""
+    n = values.shape[0]
+    out = np.empty(n, dtype=values.dtype)
+    total = 0.0
+    nobs = 0
+
+    for i in range(n):
+        cur = values[i]
+        if cur == cur:
+            total += cur
+            nobs += 1
+        if i >= window:
+            old = values[i - window]
+            if old == old:
+                total -= old
+                nobs -= 1
+        out[i] = total / nobs if nobs >= window else np.nan
+
+    return out
+
+
+@njit(_signatures('{t}[::1]({t}[::1], {t}[::1], {t}[::1])'), **_KERNEL_OPTIONS)
+def _true_range(high, low, close):
+    """True range; the first candle has no previous close so uses high - low"""
+    n = high.shape[0]
+    out = np.empty(n, dtype=high.dtype)
+    if n == 0:
+        return out
+
+    out[0] = high[0] - low[0]
+    for i in range(1, n):
+        high_low = high[i] - low[i]
+        high_close = abs(high[i] - close[i - 1])
+        low_close = abs(low[i] - close[i - 1])
+        out[i] = max(high_low, high_close, low_close)
+
+    return out
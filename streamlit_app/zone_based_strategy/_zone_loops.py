@@ -0,0 +1,53 @@
+"""
+Compiled geometry loop for ZoneTrader._plot_candlesticks
+Builds the wick segments and body rectangles for matplotlib collections
+"""
+
+import numpy as np
+from ._njit import njit
+
+_BODY_HALF_WIDTH = 0.4
+
+
+@njit(['Tuple((float64[:, :, ::1], float64[:, :, ::1], boolean[::1]))'
+       '(int64[::1], {t}[::1], {t}[::1], {t}[::1], {t}[::1])'.format(t=t)
+       for t in ('float32', 'float64')], cache=True)
+def _candle_verts(x, open_, high, low, close):
+    """
+    Return (wick segments, body vertices, bullish flags) for the candles
+    Wicks are one (low, high) segment per candle; bodies are four-corner
+    rectangles for candles whose close differs from the open
+    """
+    n = x.shape[0]
+    wicks = np.empty((n, 2, 2))
+    n_bodies = 0
+    for i in range(n):
+        wicks[i, 0, 0] = x[i]
+        wicks[i, 0, 1] = low[i]
+        wicks[i, 1, 0] = x[i]
+        wicks[i, 1, 1] = high[i]
+        if close[i] != open_[i]:
+            n_bodies += 1
+
+    bodies = np.empty((n_bodies, 4, 2))
+    bullish = np.empty(n_bodies, dtype=np.bool_)
+    j = 0
+    for i in range(n):
+        if close[i] == open_[i]:
+            continue
+        bottom = min(open_[i], close[i])
+        top = max(open_[i], close[i])
+        left = x[i] - _BODY_HALF_WIDTH
+        right = x[i] + _BODY_HALF_WIDTH
+        bodies[j, 0, 0] = left
+        bodies[j, 0, 1] = bottom
+        bodies[j, 1, 0] = right
+        bodies[j, 1, 1] = bottom
+        bodies[j, 2, 0] = right
+        bodies[j, 2, 1] = top
+        bodies[j, 3, 0] = left
+        bodies[j, 3, 1] = top
+        bullish[j] = close[i] > open_[i]
+        j += 1
+
+    return wicks, bodies, bullish
@@ -6,10 +6,7 @@ Adaptive zone sizing based on market conditions, volatility, and trend strength
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import trading_config as tc
+from . import trading_config as tc
 
 class DynamicZones:
     """
@@ -5,11 +5,86 @@ Modular system for better entry timing and zone rejection detection
 
 import pandas as pd
 import numpy as np
+from collections import OrderedDict
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Tuple
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import trading_config as tc
+from . import trading_config as tc
+from ._entry_timing_kernels import _detect_rejection
+
+_OHLC_COLUMNS = ('open', 'high', 'low', 'close')
+_BAR_FIELDS = _OHLC_COLUMNS + ('volume',)
+
+# Candles averaged by the volume confirmation
+_VOLUME_LOOKBACK = 5
+
+# Zone tables kept per EntryTiming instance; zones dicts are rebuilt
+# every few bars, so only the most recent handful are worth keeping
+_ZONE_ARRAY_CACHE_SIZE = 8
+
+@dataclass
+class ZoneTable:
+    """
+    Zones as parallel column arrays instead of a dict of dicts
+    Every containment check runs against all zones at once
+    """
+    names: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    center: np.ndarray
+    inv_heights: np.ndarray
+    # (order, sorted lower, sorted upper) when no two zones overlap, else None
+    search: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]] = None
+    
+    @classmethod
+    def from_dict(cls, zones: Dict) -> 'ZoneTable':
+        """Pack a {name: {'lower', 'upper', 'center', ...}} zones dict"""
+        names = np.array(list(zones), dtype=object)
+        count = len(names)
+        lower = np.fromiter((zone['lower'] for zone in zones.values()), dtype=np.float64, count=count)
+        upper = np.fromiter((zone['upper'] for zone in zones.values()), dtype=np.float64, count=count)
+        center = np.fromiter((zone['center'] for zone in zones.values()), dtype=np.float64, count=count)
+        inv_heights = 1.0 / np.maximum(upper - lower, 1e-12)
+        
+        search = None
+        if count:
+            order = np.argsort(lower, kind='stable')
+            sorted_lower = lower[order]
+            sorted_upper = upper[order]
+            # Strictly disjoint, so at most one zone can contain any price
+            if np.all(sorted_lower[1:] > sorted_upper[:-1]):
+                search = (order, sorted_lower, sorted_upper)
+        return cls(names, lower, upper, center, inv_heights, search)
+    
+    def find(self, level: float) -> int:
+        """Index of the first zone with lower <= level <= upper, or -1"""
+        if self.search is not None:
+            order, sorted_lower, sorted_upper = self.search
+            j = int(np.searchsorted(sorted_lower, level, side='right')) - 1
+            return int(order[j]) if j >= 0 and sorted_upper[j] >= level else -1
+        
+        # Overlapping zones - first match in zone order
+        in_zone = (self.lower <= level) & (level <= self.upper)
+        return int(np.argmax(in_zone)) if in_zone.any() else -1
+
+class _FrameBars(dict):
+    """
+    Column arrays of a dataframe, pulled out on first access
+    Each column is a zero-copy view of its last `capacity` values, so a method
+    only pays for the columns it reads
+    """
+    
+    def __init__(self, df: pd.DataFrame, capacity: int):
+        super().__init__()
+        self._df = df
+        self._capacity = capacity
+    
+    def __missing__(self, col: str) -> np.ndarray:
+        values = self._df[col].to_numpy(copy=False)[-self._capacity:]
+        self[col] = values
+        return values
+    
+    def get(self, col: str, default=None):
+        return self[col] if col in self._df.columns else default
 
 class EntryTiming:
     """
@@ -24,109 +99,200 @@ class EntryTiming:
             'BREAKOUT_RETEST': self._breakout_retest_entry,
             'CONFLUENCE_CONFIRMATION': self._confluence_confirmation_entry
         }
+        # Configured method resolved once, so the usual call skips the dict lookup
+        self._default_method = tc.ENTRY_TIMING_METHOD
+        self._default_dispatch = self.entry_methods[self._default_method]
+        
+        # Config constants read on every tick, snapshotted at construction;
+        # create a new EntryTiming after applying a different preset
+        self._wick_ratio = tc.WICK_REJECTION_RATIO
+        self._pullback_lb = tc.PULLBACK_LOOKBACK
+        self._vol_mult = tc.VOLUME_CONFIRMATION_MULTIPLIER
+        self._min_confl = tc.MIN_CONFLUENCE_CONFIRMATIONS
+        self._breakout_lb = tc.BREAKOUT_LOOKBACK
+        # (name, lower, upper, center) per zone -> ZoneTable
+        self._zone_cache = OrderedDict()
+        
+        # Streaming bars fed through update(). One row per OHLCV field, written
+        # twice (slot and slot + capacity) so the latest bars are always one
+        # contiguous slice. Capacity covers the longest lookback any method uses.
+        self._capacity = max(self._pullback_lb, self._breakout_lb, _VOLUME_LOOKBACK, 3)
+        self._ohlcv_buf = np.empty((len(_BAR_FIELDS), 2 * self._capacity), dtype=np.float64)
+        self._len = 0
     
-    def get_entry_signal(self, df: pd.DataFrame, zones: Dict, 
+    def update(self, open_: float, high: float, low: float, close: float, volume: float) -> None:
+        """
+        Append one bar to the streaming buffer
+        Signals for the buffered bars are requested with df=None
+        """
+        slot = self._len % self._capacity
+        bar = (open_, high, low, close, volume)
+        self._ohlcv_buf[:, slot] = bar
+        self._ohlcv_buf[:, slot + self._capacity] = bar
+        self._len += 1
+    
+    def get_entry_signal(self, df: Optional[pd.DataFrame], zones: Dict, 
                         method: str = tc.ENTRY_TIMING_METHOD) -> Dict:
         """
         Main entry point - returns entry signal based on selected method
         
         Args:
-            df: OHLCV dataframe
-            zones: Dictionary of trading zones
+            df: OHLCV dataframe, or None to use the bars passed to update()
+            zones: Dictionary of trading zones, or a prebuilt ZoneTable
             method: Entry timing method to use
             
         Returns:
             Dict with signal, confidence, and entry details
         """
-        if method not in self.entry_methods:
+        if method is self._default_method:
+            return self._default_dispatch(df, zones)
+        
+        handler = self.entry_methods.get(method)
+        if handler is None:
             raise ValueError(f"Unknown entry method: {method}")
         
-        return self.entry_methods[method](df, zones)
+        return handler(df, zones)
     
-    def _immediate_entry(self, df: pd.DataFrame, zones: Dict) -> Dict:
+    def _bars(self, df) -> Dict[str, np.ndarray]:
+        """
+        Column arrays for df, or for the streamed bars when df is None
+        An already extracted dict of arrays is returned unchanged; dataframe
+        columns are viewed lazily rather than copied
+        """
+        if df is None:
+            n = min(self._len, self._capacity)
+            end = (self._len - 1) % self._capacity + self._capacity + 1
+            return dict(zip(_BAR_FIELDS, self._ohlcv_buf[:, end - n:end]))
+        if isinstance(df, dict):
+            return df
+        
+        # No method looks further back than `capacity` bars
+        return _FrameBars(df, self._capacity)
+    
+    def _zone_table(self, zones) -> ZoneTable:
+        """
+        ZoneTable for a zones dict, memoized on the zone bounds; a ZoneTable
+        is returned unchanged
+        Keying on the values means zones edited in place are repacked
+        """
+        if isinstance(zones, ZoneTable):
+            return zones
+        
+        key = tuple((name, zone['lower'], zone['upper'], zone['center'])
+                    for name, zone in zones.items())
+        table = self._zone_cache.get(key)
+        if table is not None:
+            self._zone_cache.move_to_end(key)
+            return table
+        
+        table = ZoneTable.from_dict(zones)
+        self._zone_cache[key] = table
+        if len(self._zone_cache) > _ZONE_ARRAY_CACHE_SIZE:
+            self._zone_cache.popitem(last=False)
+        return table
+    
+    def _immediate_entry(self, df: Optional[pd.DataFrame], zones: Dict) -> Dict:
         """
         Original method - enter immediately when price is in zone
         """
-        current_price = df['close'].iloc[-1]
+        current_price = self._bars(df)['close'][-1]
+        zone_table = self._zone_table(zones)
         
-        for zone_name, zone_data in zones.items():
-            if self._is_price_in_zone(current_price, zone_data):
-                return {
-                    'signal': 'ENTRY',
-                    'method': 'IMMEDIATE',
-                    'confidence': 30,  # Low confidence for immediate entry
-                    'zone': zone_name,
-                    'reason': f'Price in {zone_name}'
-                }
+        zone_idx = zone_table.find(current_price)
+        if zone_idx >= 0:
+            zone_name = zone_table.names[zone_idx]
+            return {
+                'signal': 'ENTRY',
+                'method': 'IMMEDIATE',
+                'confidence': 30,  # Low confidence for immediate entry
+                'zone': zone_name,
+                'reason': f'Price in {zone_name}'
+            }
         
         return {'signal': 'NO_ENTRY', 'method': 'IMMEDIATE', 'confidence': 0}
     
-    def _zone_rejection_entry(self, df: pd.DataFrame, zones: Dict) -> Dict:
+    def _zone_rejection_entry(self, df: Optional[pd.DataFrame], zones: Dict,
+                              candle: Tuple = None, zone_table: ZoneTable = None) -> Dict:
         """
         Wait for zone rejection before entering
         Higher probability entries with better risk/reward
+        candle / zone_table may be passed in when already extracted
         """
-        if len(df) < 3:
+        bars = self._bars(df)
+        if len(bars['close']) < 3:
             return {'signal': 'NO_ENTRY', 'method': 'ZONE_REJECTION', 'confidence': 0}
         
-        latest_candle = df.iloc[-1]
-        prev_candle = df.iloc[-2]
-        
-        for zone_name, zone_data in zones.items():
-            rejection_signal = self._detect_zone_rejection(latest_candle, prev_candle, zone_data)
+        # Latest candle as scalars, zones as arrays - every zone is tested at once
+        if candle is None:
+            candle = self._latest_candle(bars)
+        if zone_table is None:
+            zone_table = self._zone_table(zones)
+        zone_idx, rejection_signal = self._detect_zone_rejection(
+            candle, zone_table.lower, zone_table.upper, zone_table.center
+        )
+        
+        if rejection_signal['detected']:
+            zone_name = zone_table.names[zone_idx]
+            confidence = self._calculate_rejection_confidence(zone_table.inv_heights[zone_idx],
+                                                              rejection_signal)
             
-            if rejection_signal['detected']:
-                confidence = self._calculate_rejection_confidence(
-                    latest_candle, zone_data, rejection_signal
-                )
-                
-                return {
-                    'signal': 'ENTRY',
-                    'method': 'ZONE_REJECTION',
-                    'confidence': confidence,
-                    'zone': zone_name,
-                    'direction': rejection_signal['direction'],
-                    'reason': f'Zone rejection from {zone_name}',
-                    'rejection_details': rejection_signal
-                }
+            return {
+                'signal': 'ENTRY',
+                'method': 'ZONE_REJECTION',
+                'confidence': confidence,
+                'zone': zone_name,
+                'direction': rejection_signal['direction'],
+                'reason': f'Zone rejection from {zone_name}',
+                'rejection_details': rejection_signal
+            }
         
         return {'signal': 'NO_ENTRY', 'method': 'ZONE_REJECTION', 'confidence': 0}
     
-    def _pullback_completion_entry(self, df: pd.DataFrame, zones: Dict) -> Dict:
+    def _pullback_completion_entry(self, df: Optional[pd.DataFrame], zones: Dict,
+                                   zone_table: ZoneTable = None) -> Dict:
         """
         Enter after pullback completion within zone
+        zone_table may be passed in when already packed
         """
-        if len(df) < tc.PULLBACK_LOOKBACK:
+        bars = self._bars(df)
+        lookback = self._pullback_lb
+        if len(bars['close']) < lookback:
             return {'signal': 'NO_ENTRY', 'method': 'PULLBACK_COMPLETION', 'confidence': 0}
         
-        recent_data = df.tail(tc.PULLBACK_LOOKBACK)
-        pullback_analysis = self._analyze_pullback(recent_data)
+        # Last PULLBACK_LOOKBACK candles as array views
+        pullback_analysis = self._analyze_pullback(
+            bars['high'][-lookback:], bars['low'][-lookback:], bars['close'][-lookback:]
+        )
         
         if pullback_analysis['completed']:
-            for zone_name, zone_data in zones.items():
-                if self._is_pullback_in_zone(pullback_analysis, zone_data):
-                    confidence = self._calculate_pullback_confidence(pullback_analysis)
-                    
-                    return {
-                        'signal': 'ENTRY',
-                        'method': 'PULLBACK_COMPLETION',
-                        'confidence': confidence,
-                        'zone': zone_name,
-                        'direction': pullback_analysis['direction'],
-                        'reason': f'Pullback completion in {zone_name}',
-                        'pullback_details': pullback_analysis
-                    }
+            if zone_table is None:
+                zone_table = self._zone_table(zones)
+            zone_idx = self._is_pullback_in_zone(pullback_analysis, zone_table)
+            if zone_idx >= 0:
+                zone_name = zone_table.names[zone_idx]
+                confidence = self._calculate_pullback_confidence(pullback_analysis)
+                
+                return {
+                    'signal': 'ENTRY',
+                    'method': 'PULLBACK_COMPLETION',
+                    'confidence': confidence,
+                    'zone': zone_name,
+                    'direction': pullback_analysis['direction'],
+                    'reason': f'Pullback completion in {zone_name}',
+                    'pullback_details': pullback_analysis
+                }
         
         return {'signal': 'NO_ENTRY', 'method': 'PULLBACK_COMPLETION', 'confidence': 0}
     
-    def _breakout_retest_entry(self, df: pd.DataFrame, zones: Dict) -> Dict:
+    def _breakout_retest_entry(self, df: Optional[pd.DataFrame], zones: Dict) -> Dict:
         """
         Enter on breakout retest of zones
         """
-        if len(df) < tc.BREAKOUT_LOOKBACK:
+        bars = self._bars(df)
+        if len(bars['close']) < self._breakout_lb:
             return {'signal': 'NO_ENTRY', 'method': 'BREAKOUT_RETEST', 'confidence': 0}
         
-        breakout_analysis = self._detect_breakout_retest(df, zones)
+        breakout_analysis = self._detect_breakout_retest(bars, zones)
         
         if breakout_analysis['detected']:
             return {
@@ -141,31 +307,35 @@ class EntryTiming:
         
         return {'signal': 'NO_ENTRY', 'method': 'BREAKOUT_RETEST', 'confidence': 0}
     
-    def _confluence_confirmation_entry(self, df: pd.DataFrame, zones: Dict) -> Dict:
+    def _confluence_confirmation_entry(self, df: Optional[pd.DataFrame], zones: Dict) -> Dict:
         """
         Enter only with multiple confirmations
         """
         confirmations = []
+        conf_values = []  # scores kept alongside for a plain sum
+        signals = self._evaluate_all_signals(df, zones)
         
         # Check for multiple entry signals
-        zone_rejection = self._zone_rejection_entry(df, zones)
-        if zone_rejection['signal'] == 'ENTRY':
-            confirmations.append(('zone_rejection', zone_rejection['confidence']))
+        if signals['rejection']['signal'] == 'ENTRY':
+            confirmations.append(('zone_rejection', signals['rejection']['confidence']))
+            conf_values.append(signals['rejection']['confidence'])
         
-        pullback_completion = self._pullback_completion_entry(df, zones)
-        if pullback_completion['signal'] == 'ENTRY':
-            confirmations.append(('pullback_completion', pullback_completion['confidence']))
+        if signals['pullback']['signal'] == 'ENTRY':
+            confirmations.append(('pullback_completion', signals['pullback']['confidence']))
+            conf_values.append(signals['pullback']['confidence'])
         
         # Volume confirmation
-        if self._has_volume_confirmation(df):
+        if signals['volume']:
             confirmations.append(('volume', 15))
+            conf_values.append(15)
         
         # Price action confirmation
-        if self._has_price_action_confirmation(df):
+        if signals['price_action']:
             confirmations.append(('price_action', 20))
+            conf_values.append(20)
         
-        if len(confirmations) >= tc.MIN_CONFLUENCE_CONFIRMATIONS:
-            total_confidence = min(sum(conf for _, conf in confirmations), 95)
+        if len(confirmations) >= self._min_confl:
+            total_confidence = min(sum(conf_values), 95)
             
             return {
                 'signal': 'ENTRY',
@@ -177,50 +347,61 @@ class EntryTiming:
         
         return {'signal': 'NO_ENTRY', 'method': 'CONFLUENCE_CONFIRMATION', 'confidence': 0}
     
-    def _detect_zone_rejection(self, latest_candle: pd.Series, prev_candle: pd.Series, 
-                              zone_data: Dict) -> Dict:
+    def _evaluate_all_signals(self, df: Optional[pd.DataFrame], zones: Dict) -> Dict:
+        """
+        Evaluate every confluence predicate from one extraction of the columns,
+        the latest candle and one packing of the zones
+        """
+        bars = self._bars(df)
+        candle = self._latest_candle(bars) if len(bars['close']) else None
+        zone_table = self._zone_table(zones)
+        
+        return {
+            'rejection': self._zone_rejection_entry(bars, zones, candle=candle, zone_table=zone_table),
+            'pullback': self._pullback_completion_entry(bars, zones, zone_table=zone_table),
+            'volume': self._has_volume_confirmation(bars),
+            'price_action': self._has_price_action_confirmation(bars, candle=candle)
+        }
+    
+    def _latest_candle(self, bars: Dict[str, np.ndarray]) -> Tuple[float, float, float, float]:
+        """(open, high, low, close) of the last candle as floats"""
+        return tuple(float(bars[col][-1]) for col in _OHLC_COLUMNS)
+    
+    def _detect_zone_rejection(self, candle: Tuple, lower: np.ndarray, upper: np.ndarray,
+                              center: np.ndarray) -> Tuple[int, Dict]:
         """
         Detect zone rejection patterns
+        candle is (open, high, low, close); lower/upper/center hold one entry per zone
+        Returns the index of the first rejecting zone (-1 if none) and the signal
         """
-        # Bullish rejection from support zone
-        if (latest_candle['low'] <= zone_data['lower'] and 
-            latest_candle['close'] > zone_data['center']):
-            
-            # Check for strong wick rejection
-            body_size = abs(latest_candle['close'] - latest_candle['open'])
-            lower_wick = latest_candle['open'] - latest_candle['low'] if latest_candle['close'] > latest_candle['open'] else latest_candle['close'] - latest_candle['low']
-            
-            if lower_wick > body_size * tc.WICK_REJECTION_RATIO:
-                return {
-                    'detected': True,
-                    'direction': 'BULLISH',
-                    'type': 'SUPPORT_REJECTION',
-                    'wick_strength': lower_wick / body_size if body_size > 0 else 5.0,
-                    'bounce_distance': latest_candle['close'] - latest_candle['low']
-                }
+        zone_idx, direction, wick_strength, bounce_distance = _detect_rejection(
+            *candle, lower, upper, center, self._wick_ratio
+        )
+        
+        if direction == 1:
+            return zone_idx, {
+                'detected': True,
+                'direction': 'BULLISH',
+                'type': 'SUPPORT_REJECTION',
+                'wick_strength': wick_strength,
+                'bounce_distance': bounce_distance
+            }
         
-        # Bearish rejection from resistance zone
-        if (latest_candle['high'] >= zone_data['upper'] and 
-            latest_candle['close'] < zone_data['center']):
-            
-            body_size = abs(latest_candle['close'] - latest_candle['open'])
-            upper_wick = latest_candle['high'] - latest_candle['open'] if latest_candle['close'] < latest_candle['open'] else latest_candle['high'] - latest_candle['close']
-            
-            if upper_wick > body_size * tc.WICK_REJECTION_RATIO:
-                return {
-                    'detected': True,
-                    'direction': 'BEARISH',
-                    'type': 'RESISTANCE_REJECTION',
-                    'wick_strength': upper_wick / body_size if body_size > 0 else 5.0,
-                    'bounce_distance': latest_candle['high'] - latest_candle['close']
-                }
+        if direction == -1:
+            return zone_idx, {
+                'detected': True,
+                'direction': 'BEARISH',
+                'type': 'RESISTANCE_REJECTION',
+                'wick_strength': wick_strength,
+                'bounce_distance': bounce_distance
+            }
         
-        return {'detected': False}
+        return -1, {'detected': False}
     
-    def _calculate_rejection_confidence(self, candle: pd.Series, zone_data: Dict, 
-                                       rejection_signal: Dict) -> int:
+    def _calculate_rejection_confidence(self, inv_height: float, rejection_signal: Dict) -> int:
         """
         Calculate confidence based on rejection strength
+        inv_height is 1 / (upper - lower) of the rejected zone
         """
         base_confidence = 45
         
@@ -229,60 +410,58 @@ class EntryTiming:
         base_confidence += wick_bonus
         
         # Bounce distance bonus
-        zone_height = zone_data['upper'] - zone_data['lower']
-        bounce_ratio = rejection_signal['bounce_distance'] / zone_height
+        bounce_ratio = rejection_signal['bounce_distance'] * inv_height
         bounce_bonus = min(bounce_ratio * 20, 20)
         base_confidence += bounce_bonus
         
         return min(int(base_confidence), 95)
     
-    def _analyze_pullback(self, df: pd.DataFrame) -> Dict:
+    def _analyze_pullback(self, highs: np.ndarray, lows: np.ndarray, closes: np.ndarray) -> Dict:
         """
         Analyze if pullback is complete
         """
-        if len(df) < 3:
+        if len(closes) < 3:
             return {'completed': False}
         
-        highs = df['high'].values
-        lows = df['low'].values
-        closes = df['close'].values
-        
-        # Simple pullback detection
-        recent_trend = 'BULLISH' if closes[-1] > closes[-3] else 'BEARISH'
+        # Simple pullback detection; scalars as Python floats so float32
+        # frames are scored in double precision
+        last_close = float(closes[-1])
+        recent_trend = 'BULLISH' if last_close > closes[-3] else 'BEARISH'
         
         if recent_trend == 'BULLISH':
             # Look for pullback low and recovery
-            pullback_low = min(lows[-3:])
+            pullback_low = float(lows[-3:].min())
             current_high = highs[-1]
-            if closes[-1] > pullback_low and current_high > pullback_low:
+            if last_close > pullback_low and current_high > pullback_low:
                 return {
                     'completed': True,
                     'direction': 'BULLISH',
                     'pullback_low': pullback_low,
-                    'recovery_strength': (closes[-1] - pullback_low) / pullback_low
+                    'recovery_strength': (last_close - pullback_low) / pullback_low
                 }
         else:
             # Look for pullback high and continuation down
-            pullback_high = max(highs[-3:])
+            pullback_high = float(highs[-3:].max())
             current_low = lows[-1]
-            if closes[-1] < pullback_high and current_low < pullback_high:
+            if last_close < pullback_high and current_low < pullback_high:
                 return {
                     'completed': True,
                     'direction': 'BEARISH',
                     'pullback_high': pullback_high,
-                    'recovery_strength': (pullback_high - closes[-1]) / pullback_high
+                    'recovery_strength': (pullback_high - last_close) / pullback_high
                 }
         
         return {'completed': False}
     
-    def _is_pullback_in_zone(self, pullback_analysis: Dict, zone_data: Dict) -> bool:
+    def _is_pullback_in_zone(self, pullback_analysis: Dict, zone_table: ZoneTable) -> int:
         """
-        Check if pullback completion happened within zone
+        Find the first zone the pullback completion happened within (-1 if none)
         """
         if pullback_analysis['direction'] == 'BULLISH':
-            return zone_data['lower'] <= pullback_analysis['pullback_low'] <= zone_data['upper']
+            level = pullback_analysis['pullback_low']
         else:
-            return zone_data['lower'] <= pullback_analysis['pullback_high'] <= zone_data['upper']
+            level = pullback_analysis['pullback_high']
+        return zone_table.find(level)
     
     def _calculate_pullback_confidence(self, pullback_analysis: Dict) -> int:
         """
@@ -292,7 +471,7 @@ class EntryTiming:
         strength_bonus = min(pullback_analysis['recovery_strength'] * 100, 30)
         return min(int(base_confidence + strength_bonus), 85)
     
-    def _detect_breakout_retest(self, df: pd.DataFrame, zones: Dict) -> Dict:
+    def _detect_breakout_retest(self, bars: Dict[str, np.ndarray], zones: Dict) -> Dict:
         """
         Detect breakout and retest patterns
         """
@@ -300,38 +479,35 @@ class EntryTiming:
         # This is a complex pattern - simplified version
         return {'detected': False}
     
-    def _has_volume_confirmation(self, df: pd.DataFrame) -> bool:
+    def _has_volume_confirmation(self, bars: Dict[str, np.ndarray]) -> bool:
         """
         Check for volume confirmation
         """
-        if 'volume' not in df.columns or len(df) < 5:
+        volume = bars.get('volume')
+        if volume is None or len(volume) < _VOLUME_LOOKBACK:
             return False
         
-        recent_volume = df['volume'].iloc[-1]
-        avg_volume = df['volume'].tail(5).mean()
+        recent_volume = volume[-1]
+        avg_volume = volume[-_VOLUME_LOOKBACK:].mean()
         
-        return recent_volume > avg_volume * tc.VOLUME_CONFIRMATION_MULTIPLIER
+        return recent_volume > avg_volume * self._vol_mult
     
-    def _has_price_action_confirmation(self, df: pd.DataFrame) -> bool:
+    def _has_price_action_confirmation(self, bars: Dict[str, np.ndarray], candle: Tuple = None) -> bool:
         """
         Check for basic price action confirmation
+        candle is the latest (open, high, low, close) when already extracted
         """
-        if len(df) < 2:
+        if len(bars['close']) < 2:
             return False
         
-        latest = df.iloc[-1]
-        prev = df.iloc[-2]
+        if candle is None:
+            candle = self._latest_candle(bars)
+        _, high, low, close = candle
         
         # Strong close near high/low
-        body_position = (latest['close'] - latest['low']) / (latest['high'] - latest['low']) if latest['high'] != latest['low'] else 0.5
+        body_position = (close - low) / (high - low) if high != low else 0.5
         
         return body_position > 0.7 or body_position < 0.3
-    
-    def _is_price_in_zone(self, price: float, zone_data: Dict) -> bool:
-        """
-        Helper method to check if price is in zone
-        """
-        return zone_data['lower'] <= price <= zone_data['upper']
 
 # Configuration class for easy plug-and-play
 class EntryTimingConfig:
@@ -1,10 +1,7 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import trading_config as tc
+from . import trading_config as tc
 
 class PriceAction:
     """Price action pattern detection module"""
@@ -6,10 +6,17 @@ Advanced candlestick pattern recognition and price action analysis
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Optional, Tuple
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import trading_config as tc
+from types import MappingProxyType
+from itertools import chain
+from . import trading_config as tc
+
+# Read-only "no signal" template; callers add context keys, so hand out copies
+_NO_SIGNAL = MappingProxyType({
+    'signal': 'NO_SIGNAL',
+    'confidence': 0,
+    'patterns_found': (),
+    'pattern_count': 0
+})
 
 class PriceActionConfirmation:
     """
@@ -740,9 +747,9 @@ class PriceActionConfirmation:
         """Find confluences between patterns"""
         confluences = []
         
-        # Group patterns by direction
-        bullish_patterns = [p for p in patterns if p['direction'] == 'BULLISH']
-        bearish_patterns = [p for p in patterns if p['direction'] == 'BEARISH']
+        # Group patterns by direction and sum their confidences in one pass
+        bullish_patterns, bearish_patterns, bull_conf_sum, bear_conf_sum = \
+            self._split_by_direction(patterns)
         
         # Create confluences for each direction if multiple patterns exist
         if len(bullish_patterns) >= tc.MIN_CONFLUENCE_PATTERNS:
@@ -750,7 +757,7 @@ class PriceActionConfirmation:
                 'direction': 'BULLISH',
                 'patterns': bullish_patterns,
                 'pattern_count': len(bullish_patterns),
-                'combined_confidence': min(sum(p['confidence'] for p in bullish_patterns), 100)
+                'combined_confidence': min(bull_conf_sum, 100)
             })
         
         if len(bearish_patterns) >= tc.MIN_CONFLUENCE_PATTERNS:
@@ -758,7 +765,7 @@ class PriceActionConfirmation:
                 'direction': 'BEARISH',
                 'patterns': bearish_patterns,
                 'pattern_count': len(bearish_patterns),
-                'combined_confidence': min(sum(p['confidence'] for p in bearish_patterns), 100)
+                'combined_confidence': min(bear_conf_sum, 100)
             })
         
         return confluences
@@ -776,21 +783,39 @@ class PriceActionConfirmation:
         
         return min(max_confidence + confluence_bonus, 100)
     
+    @staticmethod
+    def _split_by_direction(patterns) -> Tuple[List[Dict], List[Dict], int, int]:
+        """
+        Split patterns into bullish and bearish lists in a single pass
+        Returns (bullish, bearish, bullish confidence sum, bearish confidence sum)
+        """
+        bullish_patterns, bearish_patterns = [], []
+        bull_conf_sum = bear_conf_sum = 0
+        for p in patterns:
+            direction = p['direction']
+            if direction == 'BULLISH':
+                bullish_patterns.append(p)
+                bull_conf_sum += p['confidence']
+            elif direction == 'BEARISH':
+                bearish_patterns.append(p)
+                bear_conf_sum += p['confidence']
+        return bullish_patterns, bearish_patterns, bull_conf_sum, bear_conf_sum
+    
     def _compile_pattern_result(self, patterns: List[Dict], method: str) -> Dict:
         """Compile pattern results into standard format"""
         if not patterns:
             return self._no_signal()
         
         # Calculate overall signal and confidence
-        bullish_patterns = [p for p in patterns if p['direction'] == 'BULLISH']
-        bearish_patterns = [p for p in patterns if p['direction'] == 'BEARISH']
+        bullish_patterns, bearish_patterns, bull_conf_sum, bear_conf_sum = \
+            self._split_by_direction(patterns)
         
         if len(bullish_patterns) > len(bearish_patterns):
             signal = 'BULLISH'
-            confidence = min(sum(p['confidence'] for p in bullish_patterns), 100)
+            confidence = min(bull_conf_sum, 100)
         elif len(bearish_patterns) > len(bullish_patterns):
             signal = 'BEARISH'
-            confidence = min(sum(p['confidence'] for p in bearish_patterns), 100)
+            confidence = min(bear_conf_sum, 100)
         else:
             signal = 'NEUTRAL'
             confidence = 40
@@ -805,12 +830,9 @@ class PriceActionConfirmation:
     
     def _combine_analysis_results(self, results: Dict) -> Dict:
         """Combine results from multiple analysis methods"""
-        all_patterns = []
-        
         # Collect all patterns
-        for method_result in results.values():
-            if method_result.get('patterns_found'):
-                all_patterns.extend(method_result['patterns_found'])
+        all_patterns = list(chain.from_iterable(
+            method_result.get('patterns_found') or () for method_result in results.values()))
         
         # Find the strongest signals
         if all_patterns:
@@ -820,12 +842,7 @@ class PriceActionConfirmation:
     
     def _no_signal(self) -> Dict:
         """Return no signal result"""
-        return {
-            'signal': 'NO_SIGNAL',
-            'confidence': 0,
-            'patterns_found': [],
-            'pattern_count': 0
-        }
+        return dict(_NO_SIGNAL)
 
 # Configuration class
 class PriceActionConfig:
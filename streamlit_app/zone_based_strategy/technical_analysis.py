@@ -1,10 +1,68 @@
 import pandas as pd
 import numpy as np
 from typing import Dict, Tuple, Optional
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import trading_config as tc
+from dataclasses import dataclass
+from . import trading_config as tc
+from ._njit import NUMBA_AVAILABLE
+from ._ta_kernels import (
+    _ewm_adjust_false, _mas_and_atr, _running_mean, _true_range
+)
+
+# Pip size per instrument - JPY pairs quote to 2 decimals, everything else to 4
+_PIP_VALUE = {
+    'USD_JPY': 0.01, 'EUR_JPY': 0.01, 'GBP_JPY': 0.01, 'AUD_JPY': 0.01,
+    'NZD_JPY': 0.01, 'CAD_JPY': 0.01, 'CHF_JPY': 0.01
+}
+_DEFAULT_PIP = 0.0001
+
+# Zone widths for the configured pip width, computed once per instrument
+_ZONE_WIDTH_CACHE = {
+    inst: tc.ZONE_WIDTH_PIPS * _PIP_VALUE.get(inst, _DEFAULT_PIP)
+    for inst in set(tc.MAJOR_PAIRS) | set(_PIP_VALUE)
+}
+
+def _latest_values(df: pd.DataFrame, columns: Tuple[str, ...]) -> Tuple[float, ...]:
+    """Values of the given columns on the last candle, as Python floats"""
+    return tuple(float(df[col].iat[-1]) for col in columns)
+
+def _make_wick_rejection_checker(ratio: float = tc.WICK_REJECTION_RATIO):
+    """
+    Build a wick rejection test with the wick/body ratio bound in
+    The checker accepts scalars or equal-length arrays of candles
+    """
+    def checker(high, low, open_, close, center):
+        body_top = np.maximum(open_, close)
+        body_bottom = np.minimum(open_, close)
+        body = body_top - body_bottom
+        
+        # Upper wick rejection (price rejected from zone resistance)
+        # or lower wick rejection (price rejected from zone support)
+        return (((high >= center) & (body_top < center) & ((high - body_top) > body * ratio)) |
+                ((low <= center) & (body_bottom > center) & ((body_bottom - low) > body * ratio)))
+    
+    return checker
+
+_wick_rejection = _make_wick_rejection_checker()
+
+# Slots of the get_zone_interaction counter array
+_FAST_T, _SLOW_T, _TREND_T, _FAST_R, _SLOW_R, _TREND_R = range(6)
+_INTERACTION_KEYS = (
+    'fast_ma_touches', 'slow_ma_touches', 'trend_ma_touches',
+    'fast_ma_rejections', 'slow_ma_rejections', 'trend_ma_rejections'
+)
+_ZONE_SLOTS = (
+    ('fast_ma_zone', _FAST_T, _FAST_R),
+    ('slow_ma_zone', _SLOW_T, _SLOW_R),
+    ('trend_ma_zone', _TREND_T, _TREND_R)
+)
+
+# The compiled kernels read the prices at full precision, so their results
+# match the pandas implementations
+_PRICE_DTYPE = np.float64
+
+def _as_price_array(series: pd.Series) -> np.ndarray:
+    """Contiguous float64 view (or copy) of a column for the compiled kernels"""
+    return np.ascontiguousarray(series.to_numpy(dtype=_PRICE_DTYPE))
 
 class TechnicalAnalysis:
     """Technical analysis module for EMA/SMA calculations and trend analysis"""
@@ -12,11 +70,17 @@ class TechnicalAnalysis:
     @staticmethod
     def calculate_ema(data: pd.Series, period: int) -> pd.Series:
         """Calculate Exponential Moving Average"""
+        if NUMBA_AVAILABLE:
+            ema = _ewm_adjust_false(_as_price_array(data), 2.0 / (period + 1))
+            return pd.Series(ema, index=data.index, name=data.name, dtype=np.float64)
         return data.ewm(span=period, adjust=False).mean()
     
     @staticmethod
     def calculate_sma(data: pd.Series, period: int) -> pd.Series:
         """Calculate Simple Moving Average"""
+        if NUMBA_AVAILABLE:
+            sma = _running_mean(_as_price_array(data), period)
+            return pd.Series(sma, index=data.index, name=data.name, dtype=np.float64)
         return data.rolling(window=period).mean()
     
     @staticmethod
@@ -28,12 +92,14 @@ class TechnicalAnalysis:
             return TechnicalAnalysis.calculate_sma(data, period)
     
     @staticmethod
-    def add_moving_averages(df: pd.DataFrame) -> pd.DataFrame:
-        """Add all configured moving averages to dataframe"""
+    def add_ma_and_atr(df: pd.DataFrame, atr_period: int = 14) -> pd.DataFrame:
+        """Add all configured moving averages and the ATR to dataframe"""
         if df is None or df.empty:
             return df
             
         df = df.copy()
+        # The ATR needs the full candle; close-only frames just get the MAs
+        has_candles = all(col in df.columns for col in ('high', 'low', 'close'))
         
         try:
             # Silently handle insufficient data without spam warnings
@@ -42,34 +108,69 @@ class TechnicalAnalysis:
                 df['fast_ma'] = np.nan
                 df['slow_ma'] = np.nan
                 df['trend_ma'] = np.nan
+                if has_candles:
+                    df['atr'] = TechnicalAnalysis.calculate_atr(df, atr_period)
                 return df
             
             # Add moving averages with minimum periods to reduce NaN values
-            df['fast_ma'] = TechnicalAnalysis.calculate_moving_average(
-                df['close'], tc.FAST_MA_PERIOD, tc.USE_EMA
-            )
+            if tc.USE_EMA and NUMBA_AVAILABLE and has_candles:
+                # EMAs and ATR from one pass over the high/low/close prices
+                mas = _mas_and_atr(
+                    _as_price_array(df['high']), _as_price_array(df['low']),
+                    _as_price_array(df['close']), *TechnicalAnalysis._ema_alphas(), atr_period
+                )
+            else:
+                mas = [
+                    TechnicalAnalysis.calculate_moving_average(df['close'], period, tc.USE_EMA)
+                    for period in (tc.FAST_MA_PERIOD, tc.SLOW_MA_PERIOD,
+                                   tc.TREND_MA_PERIOD)
+                ]
+                if has_candles:
+                    mas.append(TechnicalAnalysis.calculate_atr(df, atr_period))
             
-            df['slow_ma'] = TechnicalAnalysis.calculate_moving_average(
-                df['close'], tc.SLOW_MA_PERIOD, tc.USE_EMA
-            )
-            
-            df['trend_ma'] = TechnicalAnalysis.calculate_moving_average(
-                df['close'], tc.TREND_MA_PERIOD, tc.USE_EMA
-            )
-            
-            # Forward fill any remaining NaN values to avoid warnings
-            df['fast_ma'] = df['fast_ma'].fillna(method='ffill').fillna(df['close'].iloc[0])
-            df['slow_ma'] = df['slow_ma'].fillna(method='ffill').fillna(df['close'].iloc[0])  
-            df['trend_ma'] = df['trend_ma'].fillna(method='ffill').fillna(df['close'].iloc[0])
+            TechnicalAnalysis._assign_ma_and_atr(df, mas)
             
         except Exception as e:
             # Add columns with price values instead of NaN to prevent downstream errors
-            df['fast_ma'] = df['close']
-            df['slow_ma'] = df['close']
-            df['trend_ma'] = df['close']
+            TechnicalAnalysis._assign_fallback(df)
         
         return df
     
+    @staticmethod
+    def add_moving_averages(df: pd.DataFrame) -> pd.DataFrame:
+        """Add all configured moving averages to dataframe (the ATR column comes along)"""
+        return TechnicalAnalysis.add_ma_and_atr(df)
+    
+    @staticmethod
+    def _ema_alphas() -> Tuple[float, float, float]:
+        """Smoothing factors for the fast, slow and trend EMAs"""
+        return (2.0 / (tc.FAST_MA_PERIOD + 1),
+                2.0 / (tc.SLOW_MA_PERIOD + 1),
+                2.0 / (tc.TREND_MA_PERIOD + 1))
+    
+    @staticmethod
+    def _assign_ma_and_atr(df: pd.DataFrame, mas) -> None:
+        """
+        Store fast/slow/trend MAs and, when present as a fourth row, the ATR on df
+        Leading MA NaNs are filled with the first close
+        """
+        first_close = df['close'].iloc[0]
+        for column, values in zip(('fast_ma', 'slow_ma', 'trend_ma'), mas[:3]):
+            # Forward fill any remaining NaN values to avoid warnings
+            df[column] = pd.Series(values, index=df.index, dtype=np.float64).ffill().fillna(first_close)
+        if len(mas) > 3:
+            df['atr'] = pd.Series(mas[3], index=df.index, dtype=np.float64)
+    
+    @staticmethod
+    def _assign_fallback(df: pd.DataFrame) -> None:
+        """
+        Use the close price for every MA when the calculation fails
+        Only plain column copies, so the fallback itself cannot fail on the ATR inputs
+        """
+        df['fast_ma'] = df['close']
+        df['slow_ma'] = df['close']
+        df['trend_ma'] = df['close']
+    
     @staticmethod
     def get_trend_bias(df: pd.DataFrame) -> str:
         """
@@ -79,11 +180,11 @@ class TechnicalAnalysis:
         if df.empty or len(df) < tc.TREND_MA_PERIOD:
             return 'NEUTRAL'
         
-        latest = df.iloc[-1]
+        fast, slow, trend, close = _latest_values(df, ('fast_ma', 'slow_ma', 'trend_ma', 'close'))
         
         # Check MA alignment
-        fast_above_slow = latest['fast_ma'] > latest['slow_ma']
-        price_above_trend = latest['close'] > latest['trend_ma']
+        fast_above_slow = fast > slow
+        price_above_trend = close > trend
         
         if fast_above_slow and price_above_trend:
             return 'BULLISH'
@@ -93,7 +194,8 @@ class TechnicalAnalysis:
             return 'NEUTRAL'
     
     @staticmethod
-    def create_zones(df: pd.DataFrame, zone_width_pips: float = tc.ZONE_WIDTH_PIPS) -> Dict:
+    def create_zones(df: pd.DataFrame, zone_width_pips: float = tc.ZONE_WIDTH_PIPS,
+                     instrument: str = tc.DEFAULT_INSTRUMENT) -> Dict:
         """
         Create zones around moving averages
         Returns dictionary with zone boundaries
@@ -101,27 +203,29 @@ class TechnicalAnalysis:
         if df.empty:
             return {}
         
-        latest = df.iloc[-1]
+        fast, slow, trend = _latest_values(df, ('fast_ma', 'slow_ma', 'trend_ma'))
         
-        # Convert pips to price (assuming 4-digit pairs like EUR/USD)
-        pip_value = 0.0001
-        zone_width = zone_width_pips * pip_value
+        # Convert pips to price using the instrument's pip size
+        if zone_width_pips == tc.ZONE_WIDTH_PIPS and instrument in _ZONE_WIDTH_CACHE:
+            zone_width = _ZONE_WIDTH_CACHE[instrument]
+        else:
+            zone_width = zone_width_pips * _PIP_VALUE.get(instrument, _DEFAULT_PIP)
         
         zones = {
             'fast_ma_zone': {
-                'center': latest['fast_ma'],
-                'upper': latest['fast_ma'] + zone_width,
-                'lower': latest['fast_ma'] - zone_width
+                'center': fast,
+                'upper': fast + zone_width,
+                'lower': fast - zone_width
             },
             'slow_ma_zone': {
-                'center': latest['slow_ma'], 
-                'upper': latest['slow_ma'] + zone_width,
-                'lower': latest['slow_ma'] - zone_width
+                'center': slow, 
+                'upper': slow + zone_width,
+                'lower': slow - zone_width
             },
             'trend_ma_zone': {
-                'center': latest['trend_ma'],
-                'upper': latest['trend_ma'] + zone_width,
-                'lower': latest['trend_ma'] - zone_width
+                'center': trend,
+                'upper': trend + zone_width,
+                'lower': trend - zone_width
             }
         }
         
@@ -133,7 +237,8 @@ class TechnicalAnalysis:
         return zone['lower'] <= price <= zone['upper']
     
     @staticmethod
-    def get_zone_interaction(df: pd.DataFrame, lookback: int = 5) -> Dict:
+    def get_zone_interaction(df: pd.DataFrame, lookback: int = 5,
+                             instrument: str = tc.DEFAULT_INSTRUMENT) -> Dict:
         """
         Analyze recent price interaction with zones
         Returns information about zone touches and rejections
@@ -142,56 +247,46 @@ class TechnicalAnalysis:
             return {}
         
         recent_df = df.tail(lookback).copy()
-        zones = TechnicalAnalysis.create_zones(df)
-        
-        interactions = {
-            'fast_ma_touches': 0,
-            'slow_ma_touches': 0, 
-            'trend_ma_touches': 0,
-            'fast_ma_rejections': 0,
-            'slow_ma_rejections': 0,
-            'trend_ma_rejections': 0
-        }
+        zones = TechnicalAnalysis.create_zones(df, instrument=instrument)
+        
+        counts = np.zeros(6, dtype=np.int32)
         
-        for _, candle in recent_df.iterrows():
-            # Check touches (high/low touched zone)
-            for zone_name, zone_data in zones.items():
-                zone_key = zone_name.replace('_zone', '')
-                
-                # Touch detection
-                if (candle['low'] <= zone_data['upper'] and 
-                    candle['high'] >= zone_data['lower']):
-                    interactions[f"{zone_key}_touches"] += 1
-                
-                # Rejection detection (wick rejection)
-                if TechnicalAnalysis._is_wick_rejection(candle, zone_data):
-                    interactions[f"{zone_key}_rejections"] += 1
-        
-        return interactions
+        # float64 so comparisons against the zone bounds match scalar maths
+        high = recent_df['high'].to_numpy(dtype=np.float64)
+        low = recent_df['low'].to_numpy(dtype=np.float64)
+        open_ = recent_df['open'].to_numpy(dtype=np.float64)
+        close = recent_df['close'].to_numpy(dtype=np.float64)
+        
+        for zone_name, touch_slot, rejection_slot in _ZONE_SLOTS:
+            zone_data = zones.get(zone_name)
+            if zone_data is None:
+                continue
+            
+            # Touch detection (high/low touched zone)
+            touches = (low <= zone_data['upper']) & (high >= zone_data['lower'])
+            counts[touch_slot] += int(touches.sum())
+            
+            # Rejection detection (wick rejection)
+            rejections = _wick_rejection(high, low, open_, close, zone_data['center'])
+            counts[rejection_slot] += int(rejections.sum())
+        
+        return {key: int(count) for key, count in zip(_INTERACTION_KEYS, counts)}
     
     @staticmethod
     def _is_wick_rejection(candle: pd.Series, zone: Dict) -> bool:
         """Helper method to detect wick rejections from zones"""
-        body_top = max(candle['open'], candle['close'])
-        body_bottom = min(candle['open'], candle['close'])
-        
-        # Upper wick rejection (price rejected from zone resistance)
-        if (candle['high'] >= zone['center'] and 
-            body_top < zone['center'] and
-            (candle['high'] - body_top) > (body_top - body_bottom) * tc.WICK_REJECTION_RATIO):
-            return True
-        
-        # Lower wick rejection (price rejected from zone support)
-        if (candle['low'] <= zone['center'] and 
-            body_bottom > zone['center'] and
-            (body_bottom - candle['low']) > (body_top - body_bottom) * tc.WICK_REJECTION_RATIO):
-            return True
-        
-        return False
+        return bool(_wick_rejection(candle['high'], candle['low'], candle['open'],
+                                    candle['close'], zone['center']))
     
     @staticmethod
     def calculate_atr(df: pd.DataFrame, period: int = 14) -> pd.Series:
         """Calculate Average True Range for volatility measurement"""
+        if NUMBA_AVAILABLE:
+            true_range = _true_range(
+                _as_price_array(df['high']), _as_price_array(df['low']), _as_price_array(df['close'])
+            )
+            return pd.Series(_running_mean(true_range, period), index=df.index, dtype=np.float64)
+        
         high_low = df['high'] - df['low']
         high_close = np.abs(df['high'] - df['close'].shift())
         low_close = np.abs(df['low'] - df['close'].shift())
@@ -212,14 +307,47 @@ class TechnicalAnalysis:
         df['volume_ma'] = df['volume'].rolling(window=tc.VOLUME_LOOKBACK).mean()
         df['volume_spike'] = df['volume'] > (df['volume_ma'] * tc.VOLUME_SPIKE_MULTIPLIER)
         
-        latest = df.iloc[-1]
-        recent_spikes = df['volume_spike'].tail(5).sum()
+        # Raw scalars of the last candle (avoids building a row Series)
+        current_volume = df['volume'].values[-1]
+        average_volume = df['volume_ma'].values[-1]
+        recent_spikes = df['volume_spike'].values[-5:].sum()
         
         return {
             'has_volume': True,
-            'current_volume': latest['volume'],
-            'average_volume': latest['volume_ma'],
-            'is_spike': latest['volume_spike'],
+            'current_volume': current_volume,
+            'average_volume': average_volume,
+            'is_spike': df['volume_spike'].values[-1],
             'recent_spikes': recent_spikes,
-            'volume_ratio': latest['volume'] / latest['volume_ma'] if latest['volume_ma'] > 0 else 0
-        }
\ No newline at end of file
+            'volume_ratio': current_volume / average_volume if average_volume > 0 else 0
+        }
+
+@dataclass
+class TFBundle:
+    """
+    Column arrays for one timeframe, extracted once per analysis run
+    Lets analyzers read the latest values without pandas indexing
+    """
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    fast_ma: np.ndarray
+    slow_ma: np.ndarray
+    trend_ma: np.ndarray
+    atr: np.ndarray
+    last_atr: float
+    
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, atr_period: int = 14) -> 'TFBundle':
+        """Build a bundle from a dataframe with OHLC and moving average columns"""
+        columns = {
+            col: df[col].to_numpy() if col in df.columns else np.full(len(df), np.nan)
+            for col in ('open', 'high', 'low', 'close', 'fast_ma', 'slow_ma', 'trend_ma')
+        }
+        # The ATR column is written alongside the moving averages
+        if 'atr' in df.columns:
+            atr = df['atr'].to_numpy()
+        else:
+            atr = TechnicalAnalysis.calculate_atr(df, atr_period).to_numpy()
+        last_atr = float(atr[-1]) if len(atr) else np.nan
+        return cls(**columns, atr=atr, last_atr=last_atr)
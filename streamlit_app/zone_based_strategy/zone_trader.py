@@ -1,23 +1,82 @@
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
+import os
+import time
 from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import threading
 from typing import Dict, List, Optional, Tuple
 import warnings
 warnings.filterwarnings('ignore')
 
 import sys
-import os
-# Add the root directory to Python path
+# Add the root directory to Python path, where oanda_trader and this package live
 root_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-sys.path.insert(0, root_dir)
+if root_dir not in sys.path:
+    sys.path.insert(0, root_dir)
+
+# Run as a script (python zone_based_strategy/zone_trader.py): resolve the
+# relative imports below against the package, as described in PEP 366
+if __name__ == "__main__" and not __package__:
+    import zone_based_strategy
+    __package__ = "zone_based_strategy"
 
 from oanda_trader import OandaTrader
-from zone_based_strategy.technical_analysis import TechnicalAnalysis
-from zone_based_strategy.price_action import PriceAction
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
-import trading_config as tc
+from .technical_analysis import TechnicalAnalysis, TFBundle, _PIP_VALUE, _DEFAULT_PIP
+from .price_action import PriceAction
+from ._signal_loop import _score, _CONF, _BIAS, _SIGNALS, _DIRECTIONS
+from ._zone_loops import _candle_verts
+from . import trading_config as tc
+
+# pyplot keeps global state, so charts from concurrent analyses are drawn one at a time
+_PLOT_LOCK = threading.Lock()
+
+def _pyplot():
+    """Import pyplot on first chart, so analysis-only runs never load matplotlib"""
+    import matplotlib.pyplot as plt
+    return plt
+
+# Zone / trend results per (instrument, last candle, close prices); a new bar
+# changes the key, so entries never need explicit invalidation
+_RESULT_CACHE_SIZE = 64
+_ZONE_CACHE = OrderedDict()
+_TREND_CACHE = OrderedDict()
+_result_cache_lock = threading.Lock()
+
+def _frame_key(instrument: str, df: pd.DataFrame) -> Tuple:
+    """Cache key identifying the latest bar of a timeframe"""
+    return (instrument, df.index[-1], hash(df['close'].to_numpy().tobytes()))
+
+def _cache_get(cache: OrderedDict, key: Tuple):
+    """Return a cached result (or None), marking it recently used"""
+    with _result_cache_lock:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+        return value
+
+def _cache_put(cache: OrderedDict, key: Tuple, value) -> None:
+    """Store a result, evicting the least recently used entry when full"""
+    with _result_cache_lock:
+        cache[key] = value
+        if len(cache) > _RESULT_CACHE_SIZE:
+            cache.popitem(last=False)
+
+# Raw candles per (instrument, granularity, count), tagged with the time the
+# next complete candle is due: the close of the candle after the cached one.
+# Expiry follows OANDA's own candle times (D and H4 roll at 17:00 New York), so
+# daily data is fetched once a day and H4 once per 4 hours
+CANDLE_SECONDS = {'D': 86400, 'H4': 14400, 'H1': 3600}
+_CANDLE_CACHE: Dict[Tuple, Tuple[float, pd.DataFrame]] = {}
+_candle_cache_lock = threading.Lock()
+
+# Zone quality indexed by [min(rejections, 2)][touches >= MIN_ZONE_TOUCHES]
+_QUALITY_TABLE = (
+    ('LOW', 'LOW'),
+    ('LOW', 'MEDIUM'),
+    ('LOW', 'HIGH')
+)
 
 class ZoneTrader:
     """
@@ -39,50 +98,75 @@ class ZoneTrader:
             print(f"Fetching multi-timeframe data for {instrument}...")
         
         mtf_data = {}
+        raw_data = {}
+        
+        # Daily for trend bias, H4 for zones, H1 for execution
+        timeframes = [
+            ('daily', 'Daily', tc.TREND_TIMEFRAME),
+            ('h4', 'H4', tc.ZONE_TIMEFRAME),
+            ('h1', 'H1', tc.EXECUTION_TIMEFRAME)
+        ]
         
         try:
-            # Daily data for trend bias
-            daily_data = self.oanda.get_candles(
-                instrument, tc.TREND_TIMEFRAME, tc.CANDLE_COUNT[tc.TREND_TIMEFRAME]
-            )
-            if daily_data is not None and not daily_data.empty:
-                mtf_data['daily'] = self.ta.add_moving_averages(daily_data)
-                if tc.DEBUG_MODE:
-                    print(f"✓ Daily data: {len(daily_data)} candles")
-            else:
-                print(f"❌ No daily data received for {instrument}")
+            # Fetch all timeframes concurrently - each request is network bound.
+            # This is the only level of concurrency, so at most three requests
+            # are in flight and the multi-pair scan stays sequential
+            with ThreadPoolExecutor(max_workers=len(timeframes)) as executor:
+                futures = [
+                    executor.submit(self._cached_get_candles, instrument, granularity,
+                                    tc.CANDLE_COUNT[granularity])
+                    for _, _, granularity in timeframes
+                ]
             
-            # H4 data for zones
-            h4_data = self.oanda.get_candles(
-                instrument, tc.ZONE_TIMEFRAME, tc.CANDLE_COUNT[tc.ZONE_TIMEFRAME]
-            )
-            if h4_data is not None and not h4_data.empty:
-                mtf_data['h4'] = self.ta.add_moving_averages(h4_data)
-                if tc.DEBUG_MODE:
-                    print(f"✓ H4 data: {len(h4_data)} candles")
-            else:
-                print(f"❌ No H4 data received for {instrument}")
+            for (key, label, _), future in zip(timeframes, futures):
+                data = future.result()
+                if data is not None and not data.empty:
+                    raw_data[key] = data
+                    if tc.DEBUG_MODE:
+                        print(f"✓ {label} data: {len(data)} candles")
+                else:
+                    print(f"❌ No {label} data received for {instrument}")
             
-            # H1 data for execution
-            h1_data = self.oanda.get_candles(
-                instrument, tc.EXECUTION_TIMEFRAME, tc.CANDLE_COUNT[tc.EXECUTION_TIMEFRAME]
-            )
-            if h1_data is not None and not h1_data.empty:
-                mtf_data['h1'] = self.ta.add_moving_averages(h1_data)
-                if tc.DEBUG_MODE:
-                    print(f"✓ H1 data: {len(h1_data)} candles")
-            else:
-                print(f"❌ No H1 data received for {instrument}")
+            # Moving averages and ATR for each timeframe
+            mtf_data = {key: self.ta.add_ma_and_atr(data) for key, data in raw_data.items()}
             
         except Exception as e:
             print(f"Error fetching multi-timeframe data for {instrument}: {e}")
         
         return mtf_data
     
-    def analyze_trend_bias(self, daily_data: pd.DataFrame) -> Dict:
+    def _cached_get_candles(self, instrument: str, granularity: str, count: int) -> pd.DataFrame:
+        """
+        Fetch candles through the per-granularity cache
+        A cached frame is reused until a newer complete candle can exist;
+        granularities without a known duration are always fetched
+        """
+        duration = CANDLE_SECONDS.get(granularity)
+        if duration is None:
+            return self.oanda.get_candles(instrument, granularity, count)
+        
+        key = (instrument, granularity, count)
+        with _candle_cache_lock:
+            cached = _CANDLE_CACHE.get(key)
+        if cached is not None and time.time() < cached[0]:
+            return cached[1].copy()
+        
+        data = self.oanda.get_candles(instrument, granularity, count)
+        if data is not None and not data.empty:
+            # The index holds candle open times; the candle after the last
+            # complete one closes two durations later
+            next_close = data.index[-1].timestamp() + 2 * duration
+            with _candle_cache_lock:
+                _CANDLE_CACHE[key] = (next_close, data)
+            data = data.copy()
+        return data
+    
+    def analyze_trend_bias(self, daily_data: pd.DataFrame, bundle: TFBundle = None,
+                           instrument: str = None) -> Dict:
         """
         Analyze trend bias from higher timeframe (Daily)
         Returns trend direction and strength
+        bundle holds the daily column arrays when already extracted
         """
         if daily_data is None or daily_data.empty:
             return {
@@ -109,32 +193,42 @@ class ZoneTrader:
                 'atr': 0.0
             }
         
+        cache_key = _frame_key(instrument, daily_data)
+        cached = _cache_get(_TREND_CACHE, cache_key)
+        if cached is not None:
+            return dict(cached)
+        
         try:
             trend_bias = self.ta.get_trend_bias(daily_data)
             
+            if bundle is None:
+                bundle = TFBundle.from_frame(daily_data)
+            
             # Additional trend strength analysis
-            latest = daily_data.iloc[-1]
+            fast_ma = float(bundle.fast_ma[-1])
+            slow_ma = float(bundle.slow_ma[-1])
+            trend_ma = float(bundle.trend_ma[-1])
+            close = float(bundle.close[-1])
             
             # Check for NaN values in MAs (silently handle without warnings)
-            if (pd.isna(latest['fast_ma']) or pd.isna(latest['slow_ma']) or 
-                pd.isna(latest['trend_ma'])):
+            if pd.isna(fast_ma) or pd.isna(slow_ma) or pd.isna(trend_ma):
                 # Return neutral bias with current price as fallback values
                 return {
                     'bias': 'NEUTRAL',
                     'strength': 'WEAK',
-                    'fast_ma': latest['close'],  # Use current price as fallback
-                    'slow_ma': latest['close'],
-                    'trend_ma': latest['close'],
-                    'current_price': latest['close'],
-                    'atr': latest['close'] * 0.001  # Small ATR fallback
+                    'fast_ma': close,  # Use current price as fallback
+                    'slow_ma': close,
+                    'trend_ma': close,
+                    'current_price': close,
+                    'atr': close * 0.001  # Small ATR fallback
                 }
             
             # Check MA separation for trend strength
-            fast_slow_separation = abs(latest['fast_ma'] - latest['slow_ma'])
-            price_trend_separation = abs(latest['close'] - latest['trend_ma'])
+            fast_slow_separation = abs(fast_ma - slow_ma)
+            price_trend_separation = abs(close - trend_ma)
             
-            # Calculate ATR for relative strength measurement
-            atr = self.ta.calculate_atr(daily_data).iloc[-1]
+            # ATR for relative strength measurement
+            atr = bundle.last_atr
             
             if fast_slow_separation > atr * 0.5 and price_trend_separation > atr * 0.3:
                 strength = 'STRONG'
@@ -143,15 +237,17 @@ class ZoneTrader:
             else:
                 strength = 'WEAK'
             
-            return {
+            result = {
                 'bias': trend_bias,
                 'strength': strength,
-                'fast_ma': latest['fast_ma'],
-                'slow_ma': latest['slow_ma'],
-                'trend_ma': latest['trend_ma'],
-                'current_price': latest['close'],
+                'fast_ma': fast_ma,
+                'slow_ma': slow_ma,
+                'trend_ma': trend_ma,
+                'current_price': close,
                 'atr': atr
             }
+            _cache_put(_TREND_CACHE, cache_key, dict(result))
+            return result
             
         except Exception as e:
             print(f"Error in analyze_trend_bias: {e}")
@@ -165,7 +261,8 @@ class ZoneTrader:
                 'atr': 0.0
             }
     
-    def identify_zones(self, h4_data: pd.DataFrame) -> Dict:
+    def identify_zones(self, h4_data: pd.DataFrame, 
+                      instrument: str = tc.DEFAULT_INSTRUMENT) -> Dict:
         """
         Identify trading zones from H4 timeframe
         Returns zone data with interaction history
@@ -173,8 +270,13 @@ class ZoneTrader:
         if h4_data.empty:
             return {}
         
-        zones = self.ta.create_zones(h4_data, tc.ZONE_WIDTH_PIPS)
-        zone_interactions = self.ta.get_zone_interaction(h4_data)
+        cache_key = _frame_key(instrument, h4_data)
+        cached = _cache_get(_ZONE_CACHE, cache_key)
+        if cached is not None:
+            return {name: dict(zone) for name, zone in cached.items()}
+        
+        zones = self.ta.create_zones(h4_data, tc.ZONE_WIDTH_PIPS, instrument)
+        zone_interactions = self.ta.get_zone_interaction(h4_data, instrument=instrument)
         
         # Enhance zones with interaction data
         for zone_name in ['fast_ma_zone', 'slow_ma_zone', 'trend_ma_zone']:
@@ -186,29 +288,31 @@ class ZoneTrader:
                     zones[zone_name]['touches'], zones[zone_name]['rejections']
                 )
         
+        _cache_put(_ZONE_CACHE, cache_key, {name: dict(zone) for name, zone in zones.items()})
         return zones
     
     def _assess_zone_quality(self, touches: int, rejections: int) -> str:
         """Assess zone quality based on interaction history"""
-        if rejections >= 2 and touches >= tc.MIN_ZONE_TOUCHES:
-            return 'HIGH'
-        elif rejections >= 1 and touches >= tc.MIN_ZONE_TOUCHES:
-            return 'MEDIUM'
-        else:
-            return 'LOW'
+        return _QUALITY_TABLE[min(rejections, 2)][touches >= tc.MIN_ZONE_TOUCHES]
     
-    def find_entry_signals(self, h1_data: pd.DataFrame, zones: Dict, trend_bias: Dict) -> Dict:
+    def find_entry_signals(self, h1_data: pd.DataFrame, zones: Dict, trend_bias: Dict,
+                           bundle: TFBundle = None,
+                           instrument: str = tc.DEFAULT_INSTRUMENT) -> Dict:
         """
         Find entry signals on H1 timeframe using price action within zones
+        bundle holds the H1 column arrays when already extracted
         """
         if h1_data.empty or not zones:
-            return {'signal': 'NO_SIGNAL', 'details': {}}
+            return {'signal': 'NO_SIGNAL', 'direction': 0, 'details': {}}
+        
+        if bundle is None:
+            bundle = TFBundle.from_frame(h1_data)
         
         # Analyze price action confluence
         confluence = self.pa.analyze_price_action_confluence(h1_data, zones)
         
         # Check if price is currently in a quality zone
-        current_price = h1_data['close'].iloc[-1]
+        current_price = float(bundle.close[-1])
         in_zone = False
         active_zones = []
         
@@ -228,84 +332,65 @@ class ZoneTrader:
         
         return {
             'signal': signal_strength['signal'],
+            'direction': signal_strength['direction'],
             'confidence': signal_strength['confidence'],
             'entry_price': current_price,
             'active_zones': active_zones,
             'confluence': confluence,
             'volume_profile': volume_profile,
             'trend_alignment': self._check_trend_alignment(confluence, trend_bias),
-            'risk_reward': self._calculate_risk_reward(h1_data, zones, signal_strength['signal'])
+            'risk_reward': self._calculate_risk_reward(h1_data, zones, signal_strength['direction'],
+                                                       bundle, instrument)
         }
     
     def _calculate_signal_strength(self, confluence: Dict, trend_bias: Dict, 
                                  in_zone: bool, volume_profile: Dict, active_zones: List) -> Dict:
         """Calculate overall signal strength and direction"""
+        direction, base_confidence = _CONF.get(confluence['signal'], (0, 0))
         
-        base_confidence = 0
-        signal = 'NO_SIGNAL'
-        
-        # Confluence contribution
-        if confluence['signal'] in ['STRONG_BULLISH', 'STRONG_BEARISH']:
-            base_confidence += 40
-            signal = confluence['signal'].replace('STRONG_', '')
-        elif confluence['signal'] in ['BULLISH', 'BEARISH']:
-            base_confidence += 20
-            signal = confluence['signal']
-        
-        # Zone quality contribution
+        # Only the fast/slow zones count towards zone quality
+        high_quality_zones = 0
         if in_zone:
             high_quality_zones = sum(1 for zone in active_zones 
                                    if zone in ['fast_ma_zone', 'slow_ma_zone'])
-            base_confidence += high_quality_zones * 15
         
-        # Trend alignment contribution
-        if trend_bias['bias'] != 'NEUTRAL':
-            if ((signal == 'BULLISH' and trend_bias['bias'] == 'BULLISH') or
-                (signal == 'BEARISH' and trend_bias['bias'] == 'BEARISH')):
-                base_confidence += 25 if trend_bias['strength'] == 'STRONG' else 15
-            else:
-                base_confidence -= 20  # Counter-trend penalty
-        
-        # Volume contribution
-        if volume_profile.get('is_spike', False):
-            base_confidence += 10
-        
-        # Final signal determination
-        if base_confidence >= 70:
-            final_signal = f'STRONG_{signal}'
-        elif base_confidence >= 50:
-            final_signal = signal
-        elif base_confidence >= 30:
-            final_signal = f'WEAK_{signal}'
-        else:
-            final_signal = 'NO_SIGNAL'
+        code, confidence = _score(
+            direction, base_confidence,
+            trend_bias['bias'] != 'NEUTRAL', _BIAS.get(trend_bias['bias'], 0),
+            trend_bias['strength'] == 'STRONG', high_quality_zones,
+            bool(volume_profile.get('is_spike', False))
+        )
         
+        # direction (-1/0/1) is what callers branch on; signal is for display
         return {
-            'signal': final_signal,
-            'confidence': min(base_confidence, 100)
+            'signal': _SIGNALS[code],
+            'direction': _DIRECTIONS[code],
+            'confidence': int(confidence)
         }
     
     def _check_trend_alignment(self, confluence: Dict, trend_bias: Dict) -> bool:
         """Check if signal aligns with higher timeframe trend"""
-        signal = confluence['signal']
-        bias = trend_bias['bias']
-        
-        if 'BULLISH' in signal and bias == 'BULLISH':
-            return True
-        elif 'BEARISH' in signal and bias == 'BEARISH':
-            return True
-        else:
-            return False
+        direction = _CONF.get(confluence['signal'], (0, 0))[0]
+        return direction != 0 and direction == _BIAS.get(trend_bias['bias'], 0)
     
-    def _calculate_risk_reward(self, h1_data: pd.DataFrame, zones: Dict, signal: str) -> Dict:
-        """Calculate risk-reward based on zones and ATR"""
-        if 'NO_SIGNAL' in signal:
+    def _calculate_risk_reward(self, h1_data: pd.DataFrame, zones: Dict, direction: int,
+                               bundle: TFBundle = None,
+                               instrument: str = tc.DEFAULT_INSTRUMENT) -> Dict:
+        """
+        Calculate risk-reward based on zones and ATR
+        direction is the signal direction: 1 bullish, -1 bearish, 0 no signal
+        """
+        if direction == 0:
             return {'stop_loss': None, 'take_profit': None, 'risk_reward': None}
         
-        current_price = h1_data['close'].iloc[-1]
-        atr = self.ta.calculate_atr(h1_data, 14).iloc[-1]
+        if bundle is None:
+            bundle = TFBundle.from_frame(h1_data)
         
-        if 'BULLISH' in signal:
+        # Python floats keep the sizing JSON-serialisable for the sheet logger
+        current_price = float(bundle.close[-1])
+        atr = bundle.last_atr
+        
+        if direction > 0:
             # For bullish signals, stop below nearest support zone
             stop_loss = current_price - (atr * 2.5)  # Widened from 1.5 to 2.5
             take_profit = current_price + (atr * tc.RISK_REWARD_RATIO * 2.5)
@@ -317,13 +402,14 @@ class ZoneTrader:
         risk = abs(current_price - stop_loss)
         reward = abs(take_profit - current_price)
         rr_ratio = reward / risk if risk > 0 else 0
+        pip = _PIP_VALUE.get(instrument, _DEFAULT_PIP)
         
         return {
             'stop_loss': stop_loss,
             'take_profit': take_profit,
             'risk_reward': rr_ratio,
-            'risk_pips': risk / 0.0001,
-            'reward_pips': reward / 0.0001
+            'risk_pips': risk / pip,
+            'reward_pips': reward / pip
         }
     
     def plot_zone_analysis(self, mtf_data: Dict, zones: Dict, entry_signals: Dict, 
@@ -331,116 +417,154 @@ class ZoneTrader:
         """
         Plot comprehensive zone analysis chart
         """
-        if not mtf_data or 'h1' not in mtf_data:
-            print("Insufficient data for plotting")
-            return
-        
-        # Check if charts are enabled in config
+        # Check if charts are enabled in config before touching the data
         import config
         if not config.SHOW_CHARTS:
             return
         
+        if not mtf_data or 'h1' not in mtf_data:
+            print("Insufficient data for plotting")
+            return
+        
         h1_data = mtf_data['h1'].tail(100)  # Show last 100 H1 candles
+        # Keep the timestamps for tick labels, then plot against a plain RangeIndex
+        timestamps = h1_data.index
+        h1_data = h1_data.reset_index(drop=True)
+        n = len(h1_data)
+        plt = _pyplot()
+        
+        # Style is scoped to this chart instead of being set/reset globally
+        with plt.style.context('dark_background'):
+            fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(tc.CHART_WIDTH, tc.CHART_HEIGHT), 
+                                           height_ratios=[3, 1])
+            fig.patch.set_facecolor('#0e1217')
+            
+            # Candle positions shared by every plot helper; int64 explicitly, as
+            # _candle_verts is compiled for it and the default is int32 on Windows
+            x = np.arange(n, dtype=np.int64)
+            
+            # Main price chart
+            self._plot_candlesticks(ax1, h1_data, x)
+            zone_handles = self._plot_zones(ax1, zones, n)
+            self._plot_moving_averages(ax1, h1_data, x, zone_handles)
+            self._plot_entry_signals(ax1, h1_data, entry_signals, x)
+            
+            # Volume chart
+            if 'volume' in h1_data.columns:
+                self._plot_volume(ax2, h1_data, x)
+            
+            # Chart styling
+            ax1.set_title(f"{instrument} - Zone-Based Analysis (H1)", 
+                         fontsize=16, color='white', fontweight='bold')
+            ax1.set_ylabel("Price", fontsize=12, color='white')
+            ax1.grid(True, alpha=0.3, color='#37474f')
+            ax1.tick_params(colors='white')
+            
+            ax2.set_ylabel("Volume", fontsize=10, color='white')
+            ax2.set_xlabel("Time", fontsize=12, color='white')
+            ax2.grid(True, alpha=0.3, color='#37474f')
+            ax2.tick_params(colors='white')
+            
+            # Format x-axis
+            n_ticks = 8
+            tick_positions = np.linspace(0, n-1, n_ticks, dtype=int)
+            tick_labels = timestamps[tick_positions].strftime('%m/%d %H:%M').tolist()
+            
+            for ax in [ax1, ax2]:
+                ax.set_xticks(tick_positions)
+                ax.set_xticklabels(tick_labels, rotation=45, ha='right', color='white')
+                ax.set_xlim(-0.5, n-0.5)
+            
+            plt.tight_layout()
+            plt.show()
         
-        plt.style.use('dark_background')
-        fig, (ax1, ax2) = plt.subplots(2, 1, figsize=(tc.CHART_WIDTH, tc.CHART_HEIGHT), 
-                                       height_ratios=[3, 1])
-        fig.patch.set_facecolor('#0e1217')
-        
-        # Main price chart
-        self._plot_candlesticks(ax1, h1_data)
-        self._plot_zones(ax1, zones, len(h1_data))
-        self._plot_moving_averages(ax1, h1_data)
-        self._plot_entry_signals(ax1, h1_data, entry_signals)
-        
-        # Volume chart
-        if 'volume' in h1_data.columns:
-            self._plot_volume(ax2, h1_data)
-        
-        # Chart styling
-        ax1.set_title(f"{instrument} - Zone-Based Analysis (H1)", 
-                     fontsize=16, color='white', fontweight='bold')
-        ax1.set_ylabel("Price", fontsize=12, color='white')
-        ax1.grid(True, alpha=0.3, color='#37474f')
-        ax1.tick_params(colors='white')
-        
-        ax2.set_ylabel("Volume", fontsize=10, color='white')
-        ax2.set_xlabel("Time", fontsize=12, color='white')
-        ax2.grid(True, alpha=0.3, color='#37474f')
-        ax2.tick_params(colors='white')
-        
-        # Format x-axis
-        n_ticks = 8
-        tick_positions = np.linspace(0, len(h1_data)-1, n_ticks, dtype=int)
-        tick_labels = [h1_data.index[i].strftime('%m/%d %H:%M') for i in tick_positions]
-        
-        for ax in [ax1, ax2]:
-            ax.set_xticks(tick_positions)
-            ax.set_xticklabels(tick_labels, rotation=45, ha='right', color='white')
-            ax.set_xlim(-0.5, len(h1_data)-0.5)
-        
-        plt.tight_layout()
-        plt.show()
-        plt.style.use('default')
+        plt.close(fig)
     
-    def _plot_candlesticks(self, ax, df):
+    def _plot_candlesticks(self, ax, df, x):
         """Plot candlesticks on given axis"""
-        bull_color = '#26a69a'
-        bear_color = '#ef5350'
+        from matplotlib.collections import LineCollection, PolyCollection
+        from matplotlib.colors import to_rgba_array
+        
+        # Row 0 is the bear colour, row 1 the bull colour
+        palette = to_rgba_array(['#ef5350', '#26a69a'])
         wick_color = '#b0bec5'
         
-        for i, (timestamp, row) in enumerate(df.iterrows()):
-            color = bull_color if row['close'] >= row['open'] else bear_color
-            
-            # Wicks
-            ax.plot([i, i], [row['low'], row['high']], 
-                   color=wick_color, linewidth=1, alpha=0.8)
-            
-            # Body
-            body_height = abs(row['close'] - row['open'])
-            body_bottom = min(row['open'], row['close'])
-            
-            if body_height > 0:
-                rect = patches.Rectangle((i - 0.4, body_bottom), 0.8, body_height,
-                                       facecolor=color, edgecolor=color, alpha=0.9)
-                ax.add_patch(rect)
+        prices = [np.ascontiguousarray(df[col].to_numpy()) for col in ('open', 'high', 'low', 'close')]
+        wick_segments, body_verts, bullish = _candle_verts(x, *prices)
+        
+        # Wicks - one (low, high) segment per candle
+        ax.add_collection(LineCollection(wick_segments, colors=wick_color,
+                                         linewidths=1, alpha=0.8))
+        
+        # Bodies - one rectangle per candle with a non-zero body
+        body_colors = palette[bullish.astype(np.intp)]
+        ax.add_collection(PolyCollection(body_verts, facecolors=body_colors,
+                                         edgecolors=body_colors, alpha=0.9))
+        
+        # Collections don't trigger autoscaling like ax.plot does
+        ax.autoscale_view()
     
     def _plot_zones(self, ax, zones, data_length):
-        """Plot trading zones as horizontal bands"""
+        """
+        Plot trading zones as horizontal bands
+        Returns legend handles for the plotted zones
+        """
+        from matplotlib.collections import PatchCollection
+        from matplotlib.patches import Patch, Rectangle
+        from matplotlib.colors import to_rgba
+        
         colors = {
             'fast_ma_zone': tc.BULLISH_ZONE_COLOR,
             'slow_ma_zone': tc.BEARISH_ZONE_COLOR,
             'trend_ma_zone': tc.NEUTRAL_ZONE_COLOR
         }
         
+        bands = []
+        band_colors = []
+        handles = []
+        
         for zone_name, zone_data in zones.items():
             if zone_data.get('quality') in ['HIGH', 'MEDIUM']:
                 color = colors.get(zone_name, '#888888')
                 alpha = 0.3 if zone_data['quality'] == 'HIGH' else 0.2
+                rgba = to_rgba(color, alpha)
                 
-                ax.axhspan(zone_data['lower'], zone_data['upper'], 
-                          color=color, alpha=alpha, label=f"{zone_name} ({zone_data['quality']})")
+                # Band spans the full candle range (the final x limits)
+                bands.append(Rectangle((-0.5, zone_data['lower']), data_length,
+                                       zone_data['upper'] - zone_data['lower']))
+                band_colors.append(rgba)
+                handles.append(Patch(color=rgba, label=f"{zone_name} ({zone_data['quality']})"))
+        
+        if bands:
+            ax.add_collection(PatchCollection(bands, facecolors=band_colors,
+                                              edgecolors=band_colors))
+        
+        return handles
     
-    def _plot_moving_averages(self, ax, df):
+    def _plot_moving_averages(self, ax, df, x, zone_handles=()):
         """Plot moving averages"""
-        x_range = range(len(df))
-        ax.plot(x_range, df['fast_ma'], color='#FFA726', linewidth=2, alpha=0.8, label=f'Fast MA ({tc.FAST_MA_PERIOD})')
-        ax.plot(x_range, df['slow_ma'], color='#EF5350', linewidth=2, alpha=0.8, label=f'Slow MA ({tc.SLOW_MA_PERIOD})')
-        ax.plot(x_range, df['trend_ma'], color='#42A5F5', linewidth=2, alpha=0.8, label=f'Trend MA ({tc.TREND_MA_PERIOD})')
-        ax.legend(loc='upper left', fontsize=8)
+        fast = df['fast_ma'].to_numpy(copy=False)
+        slow = df['slow_ma'].to_numpy(copy=False)
+        trend = df['trend_ma'].to_numpy(copy=False)
+        h_fast, = ax.plot(x, fast, color='#FFA726', linewidth=2, alpha=0.8, label=f'Fast MA ({tc.FAST_MA_PERIOD})')
+        h_slow, = ax.plot(x, slow, color='#EF5350', linewidth=2, alpha=0.8, label=f'Slow MA ({tc.SLOW_MA_PERIOD})')
+        h_trend, = ax.plot(x, trend, color='#42A5F5', linewidth=2, alpha=0.8, label=f'Trend MA ({tc.TREND_MA_PERIOD})')
+        # Explicit handles, so the legend never scans the axes' other artists
+        ax.legend(handles=[*zone_handles, h_fast, h_slow, h_trend], loc='upper left', fontsize=8)
     
-    def _plot_entry_signals(self, ax, df, signals):
+    def _plot_entry_signals(self, ax, df, signals, x):
         """Plot entry signals on chart"""
-        if signals['signal'] == 'NO_SIGNAL':
+        direction = signals.get('direction', 0)
+        if direction == 0:
             return
         
-        latest_idx = len(df) - 1
+        latest_idx = x[-1]
         latest_price = df['close'].iloc[-1]
         
-        if 'BULLISH' in signals['signal']:
+        if direction > 0:
             ax.scatter(latest_idx, latest_price, color='lime', s=200, marker='^', 
                       zorder=5, label=f"BUY - {signals['confidence']}%")
-        elif 'BEARISH' in signals['signal']:
+        else:
             ax.scatter(latest_idx, latest_price, color='red', s=200, marker='v', 
                       zorder=5, label=f"SELL - {signals['confidence']}%")
         
@@ -450,18 +574,19 @@ class ZoneTrader:
         if signals['risk_reward']['take_profit']:
             ax.axhline(signals['risk_reward']['take_profit'], color='lime', linestyle='--', alpha=0.7, label='Take Profit')
     
-    def _plot_volume(self, ax, df):
+    def _plot_volume(self, ax, df, x):
         """Plot volume bars"""
         if 'volume' not in df.columns:
             return
         
-        bull_color = '#26a69a'
-        bear_color = '#ef5350'
+        from matplotlib.colors import to_rgba_array
         
-        colors = [bull_color if df.iloc[i]['close'] >= df.iloc[i]['open'] 
-                 else bear_color for i in range(len(df))]
+        # Row 0 is the bear colour, row 1 the bull colour; indexing by the
+        # bullish mask gives an RGBA array so no per-bar colour parsing is needed
+        palette = to_rgba_array(['#ef5350', '#26a69a'])
+        bullish = df['close'].to_numpy() >= df['open'].to_numpy()
         
-        ax.bar(range(len(df)), df['volume'], color=colors, alpha=0.6)
+        ax.bar(x, df['volume'].to_numpy(), color=palette[bullish.astype(np.intp)], alpha=0.6)
     
     def run_analysis(self, instrument: str = tc.DEFAULT_INSTRUMENT) -> Dict:
         """
@@ -479,9 +604,14 @@ class ZoneTrader:
             print("❌ Failed to fetch required data")
             return {}
         
+        # Column arrays + ATR per timeframe, extracted once for the analyzers
+        bundles = {key: TFBundle.from_frame(df) for key, df in mtf_data.items()}
+        
         # Analyze trend bias from daily
         print(f"\n📈 TREND ANALYSIS ({tc.TREND_TIMEFRAME})")
-        trend_analysis = self.analyze_trend_bias(mtf_data.get('daily', pd.DataFrame()))
+        trend_analysis = self.analyze_trend_bias(
+            mtf_data.get('daily', pd.DataFrame()), bundles.get('daily'), instrument
+        )
         print(f"Trend Bias: {trend_analysis['bias']} ({trend_analysis['strength']})")
         print(f"Current Price: {trend_analysis['current_price']:.5f}")
         print(f"Fast MA: {trend_analysis['fast_ma']:.5f}")
@@ -489,7 +619,7 @@ class ZoneTrader:
         
         # Identify zones from H4
         print(f"\n🎯 ZONE ANALYSIS ({tc.ZONE_TIMEFRAME})")
-        zones = self.identify_zones(mtf_data.get('h4', pd.DataFrame()))
+        zones = self.identify_zones(mtf_data.get('h4', pd.DataFrame()), instrument)
         for zone_name, zone_data in zones.items():
             print(f"{zone_name}: {zone_data['lower']:.5f} - {zone_data['upper']:.5f} "
                   f"({zone_data['quality']} quality, {zone_data['touches']} touches)")
@@ -497,7 +627,8 @@ class ZoneTrader:
         # Find entry signals from H1
         print(f"\n⚡ ENTRY SIGNALS ({tc.EXECUTION_TIMEFRAME})")
         entry_signals = self.find_entry_signals(
-            mtf_data.get('h1', pd.DataFrame()), zones, trend_analysis
+            mtf_data.get('h1', pd.DataFrame()), zones, trend_analysis, bundles.get('h1'),
+            instrument
         )
         
         print(f"Signal: {entry_signals['signal']}")
@@ -511,7 +642,8 @@ class ZoneTrader:
         
         # Plot analysis
         if mtf_data:
-            self.plot_zone_analysis(mtf_data, zones, entry_signals, instrument)
+            with _PLOT_LOCK:
+                self.plot_zone_analysis(mtf_data, zones, entry_signals, instrument)
         
         return {
             'instrument': instrument,